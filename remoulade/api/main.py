@@ -2,7 +2,8 @@
 import sys
 from typing import Any, List
 
-from flask import Flask
+import orjson
+from flask import Flask, Response, jsonify
 from flask_apispec import marshal_with
 from marshmallow import Schema, ValidationError, fields, validate, validates_schema
 from typing_extensions import TypedDict
@@ -22,6 +23,21 @@ app = Flask(__name__)
 app.register_blueprint(scheduler_bp)
 app.register_blueprint(messages_bp)
 
+_json_default = app.json_encoder().default
+_json_options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+
+def json_response(data) -> Response:
+    """Serialize data with orjson, types unknown to orjson (ex: dates) are serialized the same way as with jsonify"""
+    try:
+        return Response(orjson.dumps(data, default=_json_default, option=_json_options), mimetype="application/json")
+    except orjson.JSONEncodeError:
+        return jsonify(data)
+
+
+# used by marshal_with to serialize the responses
+app.config["APISPEC_FORMAT_RESPONSE"] = json_response
+
 
 class MessageSchema(Schema):
     """
@@ -157,17 +173,17 @@ def get_options():
 
 @app.errorhandler(RemouladeError)
 def remoulade_exception(e):
-    return {"error": str(e)}, 500
+    return json_response({"error": str(e)}), 500
 
 
 @app.errorhandler(HTTPException)
 def http_exception(e):
-    return {"error": str(e)}, e.code
+    return json_response({"error": str(e)}), e.code
 
 
 @app.errorhandler(ValidationError)
 def validation_error(e):
-    return {"error": e.normalized_messages()}, 400
+    return json_response({"error": e.normalized_messages()}), 400
 
 
 routes = [cancel_message, requeue_message, get_results, enqueue_message, get_actors, get_options]
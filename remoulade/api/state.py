@@ -1,3 +1,10 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Tuple
+
 from flask import Blueprint
 from flask_apispec import doc, marshal_with
 from marshmallow import Schema, ValidationError, fields, validate, validates_schema
@@ -11,6 +18,46 @@ from .apispec import validate_schema
 
 messages_bp = Blueprint("messages", __name__, url_prefix="/messages")
 
+#: The time in seconds a response of /messages/states is cached, no cache if 0.
+#: The cache is local to each process and is not invalidated when states are written by the workers, so a
+#: response can be up to STATES_CACHE_TTL seconds stale. DELETE /messages/states only clears the cache of
+#: the process which handles it.
+STATES_CACHE_TTL = float(os.getenv("REMOULADE_API_STATES_CACHE_TTL", 0))
+
+_states_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+# the requests are handled by several threads
+_states_cache_lock = threading.Lock()
+
+
+def _build_states_cache_key(params: Dict[str, Any]) -> str:
+    """Given the search parameters of /messages/states, return its cache key"""
+    return hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _get_cached_states(key: str):
+    with _states_cache_lock:
+        cached = _states_cache.get(key)
+        if cached is None:
+            return None
+        expiration, response = cached
+        if time.monotonic() > expiration:
+            del _states_cache[key]
+            return None
+        return response
+
+
+def _set_cached_states(key: str, response: Dict[str, Any]) -> None:
+    with _states_cache_lock:
+        now = time.monotonic()
+        for expired_key in [k for (k, (expiration, _)) in _states_cache.items() if now > expiration]:
+            del _states_cache[expired_key]
+        _states_cache[key] = (now + STATES_CACHE_TTL, response)
+
+
+def _clear_cached_states() -> None:
+    with _states_cache_lock:
+        _states_cache.clear()
+
 
 class DeleteSchema(Schema):
     """
@@ -32,7 +79,7 @@ class StatesParamsSchema(Schema):
     )
     sort_direction = fields.Str(allow_none=True, validate=validate.OneOf(["asc", "desc"]))
     size = fields.Int(allow_none=True, validate=validate.Range(min=1, max=1000))
-    offset = fields.Int(missing=0)
+    offset = fields.Int(missing=0, validate=validate.Range(min=0))
     selected_actors = fields.List(fields.String, allow_none=True)
     selected_statuses = fields.List(
         fields.String(validate=validate.OneOf([status.name for status in StateStatusesEnum])),
@@ -75,10 +122,21 @@ class StatesResponseSchema(Schema):
 @marshal_with(StatesResponseSchema)
 @validate_schema(StatesParamsSchema)
 def get_states(**kwargs):
+    cache_key = None
+    if STATES_CACHE_TTL > 0:
+        cache_key = _build_states_cache_key(kwargs)
+        response = _get_cached_states(cache_key)
+        if response is not None:
+            return response
+
     backend = get_broker().get_state_backend()
-    data = [state.as_dict() for state in backend.get_states(**kwargs)]
-    StatesResponseSchema().load({"data": data, "count": backend.get_states_count(**kwargs)})
-    return {"data": data, "count": backend.get_states_count(**kwargs)}
+    data = backend.get_states_as_dicts(**kwargs)
+    count = backend.get_states_count(**kwargs)
+    response = {"data": data, "count": count}
+
+    if cache_key is not None:
+        _set_cached_states(cache_key, response)
+    return response
 
 
 @messages_bp.route("/states", methods=["DELETE"])
@@ -89,6 +147,7 @@ def clean_states(**kwargs):
     if not isinstance(backend, PostgresBackend):
         return {"error": "deleting states is only supported by the PostgresBackend"}, 400
     get_broker().get_state_backend().clean(**kwargs)
+    _clear_cached_states()
     return {"result": "ok"}
 
 
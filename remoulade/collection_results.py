@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import time
 from collections import deque
-from typing import Any, Generator, Generic, Iterable, List, Optional, TypeVar, Union, cast, overload
+from typing import Any, Generator, Generic, Iterable, List, Optional, Tuple, TypeVar, Union, cast, overload
 
 from typing_extensions import Literal
 
@@ -41,9 +41,12 @@ class CollectionResults(Generic[ResultT]):
 
     def __init__(self, children: "Iterable[ResultT]") -> None:
         self.children = list(children)
+        # the tree of results is immutable, flatten it once instead of on each access
+        self._message_ids = self._flatten_message_ids(self.children)
+        self._completed = False
 
     def __len__(self) -> int:
-        return len(self.message_ids)
+        return len(self._message_ids)
 
     @classmethod
     def from_message_ids(cls, message_ids: Iterable[str]) -> "CollectionResults[Any]":
@@ -73,17 +76,24 @@ class CollectionResults(Generic[ResultT]):
           RuntimeError: If your broker doesn't have a result backend
             set up.
         """
-        return self.completed_count == len(self)
+        # once all the jobs are completed, there is no need to ask the backend again
+        if not self._completed:
+            self._completed = self.completed_count == len(self)
+        return self._completed
 
     @property
-    def message_ids(self) -> List[str]:
+    def message_ids(self) -> Tuple[str, ...]:
+        return self._message_ids
+
+    @staticmethod
+    def _flatten_message_ids(children: "List[ResultT]") -> Tuple[str, ...]:
         message_ids: List[str] = []
-        for child in self.children:
+        for child in children:
             if isinstance(child, CollectionResults):
-                message_ids += child.message_ids
+                message_ids.extend(child.message_ids)
             else:
-                message_ids += [cast(Result[Any], child).message_id]
-        return message_ids
+                message_ids.append(cast(Result[Any], child).message_id)
+        return tuple(message_ids)
 
     @property
     def _backend(self) -> ResultBackend:
@@ -104,6 +114,8 @@ class CollectionResults(Generic[ResultT]):
         Returns:
           int: The total number of results.
         """
+        if self._completed:
+            return len(self)
         # we could use message.completed here, but we just want to make 1 call to get_status
         return self._backend.get_status(self.message_ids)
 
@@ -158,32 +170,63 @@ class CollectionResults(Generic[ResultT]):
         Returns:
           A result generator.
         """
-        deadline = None
-        if timeout:
-            deadline = time.monotonic() + timeout / 1000
+        deadline = self._get_deadline(timeout)
+        yield from self._iter_results(
+            block=block, deadline=deadline, raise_on_error=raise_on_error, forget=forget, flatten=False
+        )
+
+    def _iter_results(
+        self, *, block: bool, deadline: Optional[float], raise_on_error: bool, forget: bool, flatten: bool
+    ) -> Generator[Any, None, None]:
+        """Yield the results of each job in the collection, the results of a nested collection are yielded
+        one by one if flatten is True, else they are yielded as a list.
 
+        The deadline is shared with the nested collections, the remaining time is only computed before
+        each call to the backend.
+        """
         message_ids: List[str] = []
         for child in self.children:
-            if deadline:
-                timeout = max(0, int((deadline - time.monotonic()) * 1000))
-
             if isinstance(child, CollectionResults):
                 # before yielding collection result, get results once for all normal results before
                 if message_ids:
-                    yield from self._backend.get_results(
-                        message_ids, block=block, timeout=timeout, raise_on_error=raise_on_error, forget=forget
+                    yield from self._get_results(
+                        message_ids, block=block, deadline=deadline, raise_on_error=raise_on_error, forget=forget
                     )
                     message_ids = []
 
-                yield list(child.get(block=block, timeout=timeout, raise_on_error=raise_on_error, forget=forget))
+                child_results = child._iter_results(
+                    block=block, deadline=deadline, raise_on_error=raise_on_error, forget=forget, flatten=flatten
+                )
+                if flatten:
+                    yield from child_results
+                else:
+                    yield list(child_results)
             else:
                 message_ids.append(cast(Result[Any], child).message_id)
 
         if message_ids:
-            yield from self._backend.get_results(
-                message_ids, block=block, timeout=timeout, raise_on_error=raise_on_error, forget=forget
+            yield from self._get_results(
+                message_ids, block=block, deadline=deadline, raise_on_error=raise_on_error, forget=forget
             )
 
+    @staticmethod
+    def _get_deadline(timeout: Optional[int]) -> Optional[float]:
+        """Given a timeout in ms, return the time.monotonic() value at which it expires"""
+        if timeout is None:
+            return None
+        return time.monotonic() + timeout / 1000
+
+    def _get_results(
+        self, message_ids: List[str], *, block: bool, deadline: Optional[float], raise_on_error: bool, forget: bool
+    ) -> Iterable[Any]:
+        """Get the results of the given messages, waiting at most until the deadline"""
+        timeout = None
+        if deadline is not None:
+            timeout = max(0, int((deadline - time.monotonic()) * 1000))
+        return self._backend.get_results(
+            message_ids, block=block, timeout=timeout, raise_on_error=raise_on_error, forget=forget
+        )
+
     def wait(self, *, timeout: Optional[int] = None, raise_on_error: bool = True, forget: bool = False) -> None:
         """Block until all the jobs in the collection have finished or
         until the timeout expires.
@@ -196,6 +239,10 @@ class CollectionResults(Generic[ResultT]):
           forget(bool): if true the result is discarded from the result
             backend
         """
-        iterator = self.get(block=True, timeout=timeout, raise_on_error=raise_on_error, forget=forget)
+        # the results are discarded, so nested collections do not need to be gathered in lists
+        deadline = self._get_deadline(timeout)
+        iterator = self._iter_results(
+            block=True, deadline=deadline, raise_on_error=raise_on_error, forget=forget, flatten=True
+        )
         # Consume the iterator (https://docs.python.org/3/library/itertools.html#itertools-recipes)
         deque(iterator, maxlen=0)
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 from collections import namedtuple
 from contextlib import nullcontext
+from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Generic, Iterable, List, Optional, Tuple, TypeVar, Union, cast, overload
 
 from typing_extensions import Self, TypedDict, Unpack
@@ -107,12 +108,18 @@ class pipeline(Generic[ResultsT]):
         self.children: List[Union[Message[Any], group[Any]]] = []
         for child in children:
             if isinstance(child, pipeline):
-                self.children += child.children
+                self.children.extend(child.children)
             elif isinstance(child, group):
                 self.children.append(child)
             else:
                 self.children.append(child.copy())
 
+        # the children are not modified after construction, compute their message ids once
+        self._message_ids = tuple(
+            list(child.message_ids) if isinstance(child, group) else child.message_id for child in self.children
+        )
+        self._flat_message_ids = tuple(flatten(self._message_ids))
+
         self.cancel_on_error = cancel_on_error
         if cancel_on_error:
             self.broker.get_cancel_backend()
@@ -165,12 +172,8 @@ class pipeline(Generic[ResultsT]):
         return "pipeline([%s])" % ", ".join(str(m) for m in self.children)
 
     @property
-    def message_ids(self):
-        for child in self.children:
-            if isinstance(child, group):
-                yield list(child.message_ids)
-            else:
-                yield child.message_id
+    def message_ids(self) -> Tuple[Union[str, List], ...]:
+        return self._message_ids
 
     def run(self, *, delay: Optional[int] = None, transaction: Optional[bool] = None) -> Self:
         """Run this pipeline.
@@ -195,9 +198,9 @@ class pipeline(Generic[ResultsT]):
     @property
     def results(self) -> CollectionResults[Any]:
         """CollectionResults created from this pipeline, used for result related methods"""
-        results: List[Union[Result, CollectionResults]] = []
-        for element in self.children:
-            results += [element.results if isinstance(element, group) else element.result]
+        results: List[Union[Result, CollectionResults]] = [
+            element.results if isinstance(element, group) else element.result for element in self.children
+        ]
         return CollectionResults(results)
 
     @property
@@ -210,7 +213,7 @@ class pipeline(Generic[ResultsT]):
         """Mark all the children as cancelled"""
         broker = get_broker()
         backend = broker.get_cancel_backend()
-        backend.cancel(list(flatten(self.message_ids)))
+        backend.cancel(list(self._flat_message_ids))
 
 
 class group(Generic[ResultsT]):
@@ -240,6 +243,12 @@ class group(Generic[ResultsT]):
                 raise ValueError("Groups of groups are not supported")
             self.children.append(child)
 
+        # the children are not modified after construction, compute their message ids once
+        self._message_ids = tuple(
+            list(child.message_ids) if isinstance(child, pipeline) else child.message_id for child in self.children
+        )
+        self._flat_message_ids = tuple(flatten(self._message_ids))
+
         self.broker = get_broker()
         self.group_id: str = generate_unique_id() if group_id is None else group_id
 
@@ -263,7 +272,9 @@ class group(Generic[ResultsT]):
         if options is None:
             options = {}
         else:
-            self.broker.emit_before("build_group_pipeline", group_id=self.group_id, message_ids=list(self.message_ids))
+            # the subscribers get a copy, so that they cannot modify the cached message ids
+            message_ids = deepcopy(list(self.message_ids))
+            self.broker.emit_before("build_group_pipeline", group_id=self.group_id, message_ids=message_ids)
 
         composition_id = options.get("composition_id", self.group_id)
         cancel_on_error = options.get("cancel_on_error", self.cancel_on_error)
@@ -276,11 +287,13 @@ class group(Generic[ResultsT]):
         messages: "List[Message]" = []
         for group_child in self.children:
             if isinstance(group_child, pipeline):
-                messages += group_child.build(
-                    last_options=options, composition_id=composition_id, cancel_on_error=cancel_on_error
+                messages.extend(
+                    group_child.build(
+                        last_options=options, composition_id=composition_id, cancel_on_error=cancel_on_error
+                    )
                 )
             else:
-                messages += [group_child.build(options)]
+                messages.append(group_child.build(options))
         return messages
 
     @property
@@ -289,12 +302,8 @@ class group(Generic[ResultsT]):
         return GroupInfo(group_id=self.group_id, children_count=len(self.children))
 
     @property
-    def message_ids(self):
-        for child in self.children:
-            if isinstance(child, pipeline):
-                yield list(child.message_ids)
-            else:
-                yield child.message_id
+    def message_ids(self) -> Tuple[Union[str, List], ...]:
+        return self._message_ids
 
     def run(self, *, delay: Optional[int] = None, transaction: Optional[bool] = None) -> Self:
         """Run the actors in this group.
@@ -320,4 +329,4 @@ class group(Generic[ResultsT]):
         """Mark all the children as cancelled"""
         broker = get_broker()
         backend = broker.get_cancel_backend()
-        backend.cancel(list(flatten(self.message_ids)))
+        backend.cancel(list(self._flat_message_ids))
@@ -20,6 +20,7 @@ from typing import Iterable, List
 
 import redis
 
+from ...common import chunk
 from ...helpers.backoff import BackoffStrategy, compute_backoff
 from ..backend import BackendResult, ForgottenResult, Missing, ResultBackend, ResultMissing, ResultTimeout
 
@@ -36,6 +37,8 @@ class RedisBackend(ResultBackend):
         then all other parameters are ignored.
       url(str): An optional connection URL.  If both a URL and
         connection paramters are provided, the URL is used.
+      status_batch_size(int): The maximum number of keys checked by a
+        single EXISTS command when getting the status of messages.
       **parameters(dict): Connection parameters are passed directly
         to :class:`redis.Redis`.
 
@@ -54,10 +57,14 @@ class RedisBackend(ResultBackend):
         min_backoff=500,
         max_backoff=5000,
         backoff_strategy: BackoffStrategy = "spread_exponential",
+        status_batch_size: int = 1000,
         **parameters,
     ):
         super().__init__(namespace=namespace, encoder=encoder, default_timeout=default_timeout)
 
+        if status_batch_size < 1:
+            raise ValueError("status_batch_size must be strictly above 0")
+
         url = url or os.getenv("REMOULADE_REDIS_URL")
         if url:
             parameters["connection_pool"] = redis.ConnectionPool.from_url(url)
@@ -67,6 +74,7 @@ class RedisBackend(ResultBackend):
         self.min_backoff = min_backoff
         self.max_backoff = max_backoff
         self.backoff_strategy = backoff_strategy
+        self.status_batch_size = status_batch_size
 
     def get_results(
         self,
@@ -199,6 +207,9 @@ class RedisBackend(ResultBackend):
         return group_completion
 
     def get_status(self, message_ids: List[str]) -> int:  # type: ignore
-        if not message_ids:
-            return 0
-        return self.client.exists(*[self.build_message_key(message_id) for message_id in message_ids])
+        message_keys = (self.build_message_key(message_id) for message_id in message_ids)
+        # bound the size of each EXISTS command, but send them all in one round-trip
+        with self.client.pipeline(transaction=False) as pipe:
+            for keys in chunk(message_keys, self.status_batch_size):
+                pipe.exists(*keys)
+            return sum(pipe.execute())
@@ -1,8 +1,10 @@
 import datetime
+import heapq
 import sys
 from collections import namedtuple
 from enum import Enum
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional
 
 from dateutil.parser import parse
 
@@ -117,6 +119,13 @@ class State(
         return cls(**input_dict)
 
 
+def _as_aware(value: datetime.datetime) -> datetime.datetime:
+    """Consider naive datetimes as UTC, so that they can be compared with the stored ones"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+    return value
+
+
 class StateBackend:
     """ABC for  state backends.
 
@@ -186,6 +195,37 @@ class StateBackend:
         """Return all the states in the backend"""
         raise NotImplementedError(f"{type(self).__name__} does not implement get_all_messages")
 
+    def get_states_as_dicts(
+        self,
+        *,
+        size: Optional[int] = None,
+        offset: int = 0,
+        selected_actors: Optional[List[str]] = None,
+        selected_statuses: Optional[List[str]] = None,
+        selected_message_ids: Optional[List[str]] = None,
+        selected_composition_ids: Optional[List[str]] = None,
+        start_datetime: Optional[datetime.datetime] = None,
+        end_datetime: Optional[datetime.datetime] = None,
+        sort_column: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+    ) -> List[Dict]:
+        """Return the states in the backend as dicts (see :meth:`State.as_dict`), takes
+        the same parameters as :meth:`get_states`. Backends may override it to skip
+        building the State objects."""
+        states = self.get_states(
+            size=size,
+            offset=offset,
+            selected_actors=selected_actors,
+            selected_statuses=selected_statuses,
+            selected_message_ids=selected_message_ids,
+            selected_composition_ids=selected_composition_ids,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            sort_column=sort_column,
+            sort_direction=sort_direction,
+        )
+        return [state.as_dict() for state in states]
+
     def get_states_count(
         self,
         *,
@@ -199,13 +239,87 @@ class StateBackend:
     ) -> int:
         raise NotImplementedError(f"{type(self).__name__} does not implement get_states_count")
 
+    @staticmethod
+    def _build_state_filter(
+        *,
+        selected_actors: Optional[List[str]] = None,
+        selected_statuses: Optional[List[str]] = None,
+        selected_message_ids: Optional[List[str]] = None,
+        selected_composition_ids: Optional[List[str]] = None,
+        start_datetime: Optional[datetime.datetime] = None,
+        end_datetime: Optional[datetime.datetime] = None,
+    ) -> Optional[Callable[[State], bool]]:
+        """Return a predicate telling whether a state matches the selection, or None if nothing is selected.
+
+        The selections are converted to sets once, so that the backends filtering in Python
+        only do constant time lookups for each state.
+        """
+        checks: List[Callable[[State], bool]] = []
+        if selected_actors is not None:
+            actors = frozenset(selected_actors)
+            checks.append(lambda state: state.actor_name in actors)
+        if selected_statuses is not None:
+            statuses = frozenset(StateStatusesEnum(status) for status in selected_statuses)
+            checks.append(lambda state: state.status in statuses)
+        if selected_message_ids is not None:
+            message_ids = frozenset(selected_message_ids)
+            checks.append(lambda state: state.message_id in message_ids)
+        if selected_composition_ids is not None:
+            composition_ids = frozenset(selected_composition_ids)
+            checks.append(lambda state: state.composition_id in composition_ids)
+        if start_datetime is not None:
+            start = _as_aware(start_datetime)
+            checks.append(
+                lambda state: state.enqueued_datetime is not None and _as_aware(state.enqueued_datetime) >= start
+            )
+        if end_datetime is not None:
+            end = _as_aware(end_datetime)
+            checks.append(
+                lambda state: state.enqueued_datetime is not None and _as_aware(state.enqueued_datetime) <= end
+            )
+
+        if not checks:
+            return None
+        return lambda state: all(check(state) for check in checks)
+
+    @staticmethod
+    def _paginate_states(
+        states: Iterable[State],
+        *,
+        offset: int = 0,
+        size: Optional[int] = None,
+        sort_column: Optional[str] = None,
+        sort_direction: Optional[str] = None,
+    ) -> List[State]:
+        """Return the requested page of states, sorted by sort_column (with None values last) if defined.
+
+        When the page size is known, only the first offset + size states are selected with a heap
+        instead of sorting all of them.
+        """
+        end = None if size is None else offset + size
+        if sort_column is None:
+            return list(islice(states, offset, end))
+
+        reverse = (sort_direction or "desc") == "desc"
+
+        def sort_key(state):
+            value = getattr(state, sort_column)
+            if isinstance(value, Enum):
+                value = value.value
+            return (value is not None, value) if reverse else (value is None, value)
+
+        if end is None:
+            return sorted(states, key=sort_key, reverse=reverse)[offset:]
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(end, states, key=sort_key)[offset:]
+
     def _encode_dict(self, data):
         """Return the (keys, values) of a dictionary encoded"""
         encoded_data = {}
         for (key, value) in data.items():
             encoded_value = self.encoder.encode(value)
             if sys.getsizeof(encoded_value) <= self.max_size:
-                encoded_data[self.encoder.encode(key)] = self.encoder.encode(value)
+                encoded_data[self.encoder.encode(key)] = encoded_value
         return encoded_data
 
     def _decode_dict(self, data):
@@ -1,5 +1,7 @@
 import datetime
-from typing import List, Optional
+import math
+import time
+from typing import Dict, List, Optional
 
 import redis
 
@@ -10,6 +12,24 @@ from ..backend import State, StateBackend
 
 class RedisBackend(StateBackend):
     """A state backend for Redis_.
+
+    The ids of the stored messages are kept in a sorted set, scored by the
+    expiration time of their state, so that states can be listed and counted
+    without scanning the whole keyspace.  Unless sorted on a column, states are
+    listed by expiration time, which is the order of their last update when they
+    are all stored with the same ttl (as done by :class:`.MessageState`).  The
+    message ids of each composition are kept in a set.
+
+    The states missing from the index and the composition sets (stored before
+    they existed, or by writers still running a version without them during a
+    rolling upgrade) are indexed by scanning the keyspace on the first read,
+    then again every ``index_rebuild_interval`` seconds.
+
+    As the keys expire according to the clock of the Redis server, the scores
+    are computed from its clock (read with TIME, at most once per minute, and
+    kept as an offset to the local clock), so that the clock skew between the
+    hosts of the workers and of the API does not shift the expiration times.
+
     Parameters:
       namespace(str): A string with which to prefix result keys.
       encoder(Encoder): The encoder to use when storing and retrieving
@@ -18,16 +38,31 @@ class RedisBackend(StateBackend):
         then all other parameters are ignored.
       url(str): An optional connection URL.  If both a URL and
         connection parameters are provided, the URL is used.
+      index_rebuild_interval(int): The time, in seconds, between two
+        scans of the keyspace indexing the states missing from the index.
       **parameters(dict): Connection parameters are passed directly
         to :class:`redis.Redis`.
     .. _redis: https://redis.io
     """
 
-    def __init__(self, *, namespace="remoulade-state", encoder=None, client=None, url=None, **parameters):
+    def __init__(
+        self,
+        *,
+        namespace="remoulade-state",
+        encoder=None,
+        client=None,
+        url=None,
+        index_rebuild_interval: int = 3600,
+        **parameters,
+    ):
         super().__init__(namespace=namespace, encoder=encoder)
         if url:
             parameters["connection_pool"] = redis.ConnectionPool.from_url(url)
         self.client = client or redis.Redis(**parameters)
+        self.index_rebuild_interval = index_rebuild_interval
+        self._index_checked_until = 0.0
+        self._clock_offset = 0.0
+        self._clock_offset_checked_until = 0.0
 
     def get_state(self, message_id):
         key = self._build_message_key(message_id)
@@ -36,17 +71,114 @@ class RedisBackend(StateBackend):
             return None
         return self._parse_state(data)
 
+    def _get_time(self) -> float:
+        """Return the current timestamp of the Redis server"""
+        now = time.monotonic()
+        if now >= self._clock_offset_checked_until:
+            seconds, microseconds = self.client.time()
+            self._clock_offset = seconds + microseconds / 1_000_000 - time.time()
+            self._clock_offset_checked_until = now + 60
+        return time.time() + self._clock_offset
+
+    def _build_composition_key(self, composition_id: str) -> str:
+        """Given a composition id, return the key of the set of its message ids"""
+        return f"{self.namespace}-composition:{composition_id}"
+
+    def _build_index_key(self) -> str:
+        """Return the key of the sorted set of message ids, scored by the expiration time of their state"""
+        return f"{self.namespace}-index"
+
+    def _build_index_marker_key(self) -> str:
+        """Return the key telling that the states missing from the index have been indexed recently"""
+        return f"{self.namespace}-index-built"
+
+    def _ensure_index(self) -> None:
+        """Index the states missing from the index, at most once per index_rebuild_interval"""
+        if time.monotonic() < self._index_checked_until:
+            return
+        marker_key = self._build_index_marker_key()
+        # the marker expires so that the index is built again, and only the reader which sets it builds the index
+        if self.client.set(marker_key, 1, nx=True, ex=self.index_rebuild_interval):
+            try:
+                self._build_index()
+            except Exception:
+                self.client.delete(marker_key)
+                raise
+        self._index_checked_until = time.monotonic() + self.index_rebuild_interval
+
+    def _build_index(self, chunk_size=1000) -> None:
+        """Add the states found by scanning the keyspace to the index, scored by their expiration time,
+        and to the sets of their composition"""
+        index_key = self._build_index_key()
+        prefix_length = len(self.namespace) + 1
+        composition_fields = [self.encoder.encode("composition_id"), self.encoder.encode("options")]
+        composition_expirations: Dict[str, float] = {}
+        for keys in chunk(self.client.scan_iter(match=f"{self.namespace}:*", count=chunk_size), chunk_size):
+            with self.client.pipeline() as pipe:
+                for key in keys:
+                    pipe.pttl(key)
+                    pipe.hmget(key, composition_fields)
+                data = pipe.execute()
+            now = self._get_time()
+            with self.client.pipeline() as pipe:
+                for key, ttl, (composition_id, options) in zip(keys, data[::2], data[1::2]):
+                    if ttl < 0:  # the state has expired, or it has no ttl
+                        continue
+                    message_id = key.decode("utf-8")[prefix_length:]
+                    expiration = now + ttl / 1000
+                    # do not override the score of a state which has been updated since the scan
+                    pipe.zadd(index_key, {message_id: expiration}, nx=True)
+                    composition_id = self._get_composition_id(composition_id, options)
+                    if composition_id:
+                        pipe.sadd(self._build_composition_key(composition_id), message_id)
+                        composition_expirations[composition_id] = max(
+                            expiration, composition_expirations.get(composition_id, expiration)
+                        )
+                pipe.execute()
+
+        with self.client.pipeline() as pipe:
+            for composition_id, expiration in composition_expirations.items():
+                pipe.expireat(self._build_composition_key(composition_id), math.ceil(expiration))
+            pipe.execute()
+
+    def _get_composition_id(self, encoded_composition_id, encoded_options) -> Optional[str]:
+        """Return the composition id of a stored state, given its encoded composition_id and options"""
+        if encoded_composition_id is not None:
+            composition_id = self.encoder.decode(encoded_composition_id)
+            if composition_id:
+                return composition_id
+        if encoded_options is not None:
+            return (self.encoder.decode(encoded_options) or {}).get("composition_id")
+        return None
+
     def set_state(self, state, ttl=3600):
         message_key = self._build_message_key(state.message_id)
+        index_key = self._build_index_key()
+        # the composition_id is only part of the first state of a message, but it is always in its options
+        composition_id = state.composition_id or (state.options or {}).get("composition_id")
+        now = self._get_time()
         with self.client.pipeline() as pipe:
+            pipe.zremrangebyscore(index_key, "-inf", now)
+            pipe.zadd(index_key, {state.message_id: now + ttl})
             encoded_state = self._encode_dict(state.as_dict())
             pipe.hset(message_key, mapping=encoded_state)
             pipe.expire(message_key, ttl)
+            if composition_id:
+                composition_key = self._build_composition_key(composition_id)
+                pipe.sadd(composition_key, state.message_id)
+                pipe.expire(composition_key, ttl)
             pipe.execute()
 
-    def get_states(
+    def get_states(self, **kwargs):
+        return self._get_states_page(as_dicts=False, **kwargs)
+
+    def get_states_as_dicts(self, **kwargs):
+        return self._get_states_page(as_dicts=True, **kwargs)
+
+    def _get_states_page(
         self,
         *,
+        as_dicts: bool,
         size: Optional[int] = None,
         offset: int = 0,
         selected_actors: Optional[List[str]] = None,
@@ -57,21 +189,34 @@ class RedisBackend(StateBackend):
         end_datetime: Optional[datetime.datetime] = None,
         sort_column: Optional[str] = None,
         sort_direction: Optional[str] = None,
-    ):
-        states = []
-        for keys in chunk(self.client.scan_iter(match=f"{StateBackend.namespace}*", count=size), size):
-            with self.client.pipeline() as pipe:
-                for key in keys:
-                    pipe.hgetall(key)
-                data = pipe.execute()
-                for state_dict in data:
-                    if state_dict:
-                        states.append(self._parse_state(state_dict))
-
-        if size is None:
-            return states[offset:]
+    ) -> list:
+        """Return a page of states, as dicts if as_dicts is True"""
+        self._ensure_index()
+        state_filter = self._build_state_filter(
+            selected_actors=selected_actors,
+            selected_statuses=selected_statuses,
+            selected_message_ids=selected_message_ids,
+            selected_composition_ids=selected_composition_ids,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+        )
+        if state_filter is None and sort_column is None:
+            # the index is already sorted, only fetch the states of the requested page. The stored states are
+            # encoded from State.as_dict, so they can be returned as dicts without building States
+            keys = self._get_indexed_message_keys(offset, size)
+            iter_page = self._iter_state_dicts if as_dicts else self._iter_states
+            return list(iter_page(keys, size))
 
-        return states[offset : size + offset]
+        keys = self._get_message_keys(selected_message_ids, selected_composition_ids)
+        states = self._iter_states(keys)
+        if state_filter is not None:
+            states = filter(state_filter, states)
+        page = self._paginate_states(
+            states, offset=offset, size=size, sort_column=sort_column, sort_direction=sort_direction
+        )
+        if as_dicts:
+            return [state.as_dict() for state in page]
+        return page
 
     def get_states_count(
         self,
@@ -84,7 +229,56 @@ class RedisBackend(StateBackend):
         end_datetime: Optional[datetime.datetime] = None,
         **kwargs,
     ) -> int:
-        return len(list(self.client.scan_iter(match=f"{StateBackend.namespace}*")))
+        self._ensure_index()
+        selected_message_ids = selected_messages_ids or kwargs.get("selected_message_ids")
+        state_filter = self._build_state_filter(
+            selected_actors=selected_actors,
+            selected_statuses=selected_statuses,
+            selected_message_ids=selected_message_ids,
+            selected_composition_ids=selected_composition_ids,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+        )
+        if state_filter is None:
+            return self.client.zcount(self._build_index_key(), self._get_time(), "+inf")
+        keys = self._get_message_keys(selected_message_ids, selected_composition_ids)
+        return sum(1 for _ in filter(state_filter, self._iter_states(keys)))
+
+    def _get_message_keys(self, selected_message_ids=None, selected_composition_ids=None):
+        """Return the keys of the states, only the ones of the given messages or compositions if any"""
+        if selected_message_ids is not None:
+            return [self._build_message_key(message_id) for message_id in selected_message_ids]
+        if selected_composition_ids is None:
+            return self._get_indexed_message_keys()
+
+        with self.client.pipeline() as pipe:
+            for composition_id in selected_composition_ids:
+                pipe.smembers(self._build_composition_key(composition_id))
+            message_ids = set().union(*pipe.execute())
+        return [self._build_message_key(message_id.decode("utf-8")) for message_id in message_ids]
+
+    def _get_indexed_message_keys(self, offset=0, size=None):
+        """Return the keys of the states which have not expired, by descending expiration time"""
+        message_ids = self.client.zrevrangebyscore(
+            self._build_index_key(), "+inf", self._get_time(), start=offset, num=-1 if size is None else size
+        )
+        return [self._build_message_key(message_id.decode("utf-8")) for message_id in message_ids]
+
+    def _iter_state_dicts(self, keys, chunk_size=None):
+        """Fetch and decode the states of the given keys, chunk by chunk, skipping the ones which have expired"""
+        for keys_chunk in chunk(keys, chunk_size or 1000):
+            with self.client.pipeline() as pipe:
+                for key in keys_chunk:
+                    pipe.hgetall(key)
+                data = pipe.execute()
+            for state_dict in data:
+                if state_dict:
+                    yield self._decode_dict(state_dict)
+
+    def _iter_states(self, keys, chunk_size=None):
+        """Fetch the states of the given keys, chunk by chunk, skipping the ones which have expired"""
+        for state_dict in self._iter_state_dicts(keys, chunk_size):
+            yield State.from_dict(state_dict)
 
     def _parse_state(self, data):
         decoded_state = self._decode_dict(data)
@@ -59,18 +59,33 @@ class StubBackend(StateBackend):
         sort_column: Optional[str] = None,
         sort_direction: Optional[str] = None,
     ):
+        state_filter = self._build_state_filter(
+            selected_actors=selected_actors,
+            selected_statuses=selected_statuses,
+            selected_message_ids=selected_message_ids,
+            selected_composition_ids=selected_composition_ids,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+        )
+        states = self._iter_states()
+        if state_filter is not None:
+            states = filter(state_filter, states)
+        # states are decoded lazily, so without filter and sort only the requested page is decoded
+        return self._paginate_states(
+            states, offset=offset, size=size, sort_column=sort_column, sort_direction=sort_direction
+        )
+
+    def _iter_states(self):
+        """Decode the stored states one by one, deleting the ones which have expired"""
         time_now = time.monotonic()
-        states = []
         for message_key in list(self.states.keys()):
-            data = self.states[message_key]
+            data = self.states.get(message_key)
+            if data is None:
+                continue
             if time_now > float(data["expiration"]):
                 self._delete(message_key)
                 continue
-            state = State.from_dict(self._decode_dict(data["state"]))
-            states.append(state)
-        if size is None:
-            return states[offset:]
-        return states[offset : size + offset]
+            yield State.from_dict(self._decode_dict(data["state"]))
 
     def get_states_count(
         self,
@@ -83,4 +98,14 @@ class StubBackend(StateBackend):
         end_datetime: Optional[datetime.datetime] = None,
         **kwargs,
     ) -> int:
-        return len(self.states)
+        selection = dict(
+            selected_actors=selected_actors,
+            selected_statuses=selected_statuses,
+            selected_message_ids=selected_messages_ids or kwargs.get("selected_message_ids"),
+            selected_composition_ids=selected_composition_ids,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+        )
+        if self._build_state_filter(**selection) is None:
+            return len(self.states)
+        return len(self.get_states(**selection))
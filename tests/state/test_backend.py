@@ -1,9 +1,20 @@
+import datetime
+import time
+from unittest import mock
+
 import pytest
 
 from remoulade.state import State, StateStatusesEnum
 from remoulade.state.backends import PostgresBackend
 
 
+def set_state_without_index(backend, state, ttl):
+    """Store a state the way versions of the RedisBackend without index did"""
+    message_key = backend._build_message_key(state.message_id)
+    backend.client.hset(message_key, mapping=backend._encode_dict(state.as_dict()))
+    backend.client.expire(message_key, ttl)
+
+
 class TestStateBackend:
     """This class test the different methods of state
     backend"""
@@ -45,8 +56,6 @@ class TestStateBackend:
         assert backend.get_states_count() == 2
 
     def test_sort_with_offset(self, stub_broker, state_middleware):
-        if not isinstance(state_middleware.backend, PostgresBackend):
-            pytest.skip()
         backend = state_middleware.backend
         for i in range(8):
             backend.set_state(State(f"id{i}", actor_name=f"{3 + 4 * (i//4) - i%4}"))
@@ -59,3 +68,91 @@ class TestStateBackend:
         assert res[0].actor_name == "0"
         assert res[1].actor_name == "1"
         assert res[2].actor_name == "2"
+        res = backend.get_states(size=3, offset=6, sort_column="actor_name", sort_direction="asc")
+        assert [state.actor_name for state in res] == ["6", "7"]
+
+    def test_select_states(self, stub_broker, state_middleware):
+        backend = state_middleware.backend
+        for i in range(4):
+            backend.set_state(
+                State(
+                    f"id{i}",
+                    StateStatusesEnum.Success if i % 2 else StateStatusesEnum.Pending,
+                    actor_name=f"actor{i % 2}",
+                )
+            )
+
+        res = backend.get_states(selected_actors=["actor1"], selected_statuses=["Success"])
+        assert sorted(state.message_id for state in res) == ["id1", "id3"]
+        assert backend.get_states_count(selected_actors=["actor0"]) == 2
+        assert backend.get_states_count(selected_actors=["actor0"], selected_statuses=["Success"]) == 0
+
+    def test_select_compositions(self, stub_broker, state_middleware):
+        backend = state_middleware.backend
+        for i in range(4):
+            backend.set_state(State(f"id{i}", composition_id=f"composition{i % 2}"))
+        backend.set_state(State("id4"))
+
+        res = backend.get_states(selected_composition_ids=["composition1"])
+        assert sorted(state.message_id for state in res) == ["id1", "id3"]
+        res = backend.get_states(selected_composition_ids=["composition0"])
+        assert sorted(state.message_id for state in res) == ["id0", "id2"]
+        # the PostgresBackend counts the compositions, the other backends count the states
+        expected_count = 1 if isinstance(backend, PostgresBackend) else 2
+        assert backend.get_states_count(selected_composition_ids=["composition0"]) == expected_count
+        assert backend.get_states_count(selected_composition_ids=["unknown"]) == 0
+
+    def test_redis_states_by_expiration(self, stub_broker, redis_state_backend):
+        for i in range(3):
+            redis_state_backend.set_state(State(f"id{i}"), ttl=100 * (i + 1))
+        redis_state_backend.set_state(State("id0"), ttl=1000)
+        redis_state_backend.set_state(State("expired"), ttl=-1)
+
+        assert [state.message_id for state in redis_state_backend.get_states(size=2)] == ["id0", "id2"]
+        assert [state.message_id for state in redis_state_backend.get_states(offset=2)] == ["id1"]
+        assert redis_state_backend.get_states_count() == 3
+
+    def test_redis_index_states_stored_without_index(self, stub_broker, redis_state_backend):
+        set_state_without_index(redis_state_backend, State("legacy", composition_id="composition"), ttl=100)
+        redis_state_backend.set_state(State("id0"), ttl=1000)
+
+        assert [state.message_id for state in redis_state_backend.get_states()] == ["id0", "legacy"]
+        assert redis_state_backend.get_states_count() == 2
+        assert redis_state_backend.get_states_count(selected_composition_ids=["composition"]) == 1
+
+    def test_redis_index_built_again_after_interval(self, stub_broker, redis_state_backend):
+        redis_state_backend.index_rebuild_interval = 1
+        assert redis_state_backend.get_states_count() == 0
+
+        # a state stored by a writer still running a version of the backend without index
+        set_state_without_index(redis_state_backend, State("legacy"), ttl=100)
+        assert redis_state_backend.get_states_count() == 0
+        time.sleep(1.1)
+        assert redis_state_backend.get_states_count() == 1
+
+    def test_redis_index_follows_server_clock(self, stub_broker, redis_state_backend):
+        # the local clock is one hour late compared to the one of the Redis server
+        late_time = time.time() - 3600
+        with mock.patch("time.time", return_value=late_time):
+            redis_state_backend.set_state(State("id0"), ttl=100)
+
+        index_key = redis_state_backend._build_index_key()
+        seconds, _ = redis_state_backend.client.time()
+        ((_, score),) = redis_state_backend.client.zrange(index_key, 0, -1, withscores=True)
+        assert seconds < score <= seconds + 101
+
+    def test_get_states_as_dicts(self, stub_broker, state_middleware):
+        backend = state_middleware.backend
+        for i in range(3):
+            backend.set_state(
+                State(
+                    f"id{i}",
+                    StateStatusesEnum.Pending,
+                    actor_name="do_work",
+                    args=[i],
+                    enqueued_datetime=datetime.datetime(2020, 1, 1, i, 30, 15, 1234, tzinfo=datetime.timezone.utc),
+                )
+            )
+        backend.set_state(State("id1", StateStatusesEnum.Success), ttl=1000)
+
+        assert backend.get_states_as_dicts(size=10) == [state.as_dict() for state in backend.get_states(size=10)]
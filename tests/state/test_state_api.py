@@ -6,13 +6,14 @@ from random import choice
 from unittest import mock
 from unittest.mock import MagicMock
 
+import flask
 import pytest
 import pytz
 from dateutil.parser import parse
 
 import remoulade
 from remoulade import set_scheduler
-from remoulade.api.main import app
+from remoulade.api.main import app, json_response
 from remoulade.cancel import Cancel
 from remoulade.message import Message
 from remoulade.scheduler import ScheduledJob
@@ -37,6 +38,29 @@ class TestMessageStateAPI:
         )
         assert res.status_code == 400
 
+    def test_error_response(self, stub_broker, api_client):
+        res = api_client.get("/messages/states/unknown")
+        assert res.status_code == 404
+        assert res.mimetype == "application/json"
+        assert res.json == {"error": "404 Not Found: message_id = unknown does not exist"}
+
+    def test_json_response_datetime(self):
+        data = {"date": datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)}
+        with app.test_request_context():
+            res = json_response(data)
+            expected = json.loads(flask.jsonify(data).data)
+        # datetimes are serialized the same way as with jsonify
+        assert res.mimetype == "application/json"
+        assert json.loads(res.data) == expected == {"date": "Thu, 02 Jan 2020 03:04:05 GMT"}
+
+    def test_json_response_fallback(self):
+        # orjson does not serialize integers wider than 64 bits, the response falls back on jsonify
+        data = {"value": 2 ** 70}
+        with app.test_request_context():
+            res = json_response(data)
+        assert res.mimetype == "application/json"
+        assert json.loads(res.data) == data
+
     @pytest.mark.parametrize("status", [StateStatusesEnum.Skipped, StateStatusesEnum.Success])
     def test_get_state_by_name(self, status, stub_broker, state_middleware, api_client):
         state = State("1", status)
@@ -195,6 +219,19 @@ class TestMessageStateAPI:
         res = api_client.post("/messages/states", data=json.dumps(data), content_type="application/json")
         assert res.json == {"count": 1, "data": [state.as_dict()]}
 
+    def test_get_states_cached(self, stub_broker, api_client, state_middleware, monkeypatch):
+        monkeypatch.setattr("remoulade.api.state.STATES_CACHE_TTL", 10)
+        monkeypatch.setattr("remoulade.api.state._states_cache", {})
+        state_middleware.backend.set_state(State("id0"), ttl=1000)
+        res = api_client.post("/messages/states", data=json.dumps({"size": 10}), content_type="application/json")
+        assert res.json["count"] == 1
+
+        state_middleware.backend.set_state(State("id1"), ttl=1000)
+        res = api_client.post("/messages/states", data=json.dumps({"size": 10}), content_type="application/json")
+        assert res.json["count"] == 1
+        res = api_client.post("/messages/states", data=json.dumps({"size": 20}), content_type="application/json")
+        assert res.json["count"] == 2
+
     @pytest.mark.parametrize("offset", [0, 1, 5, 100])
     def test_get_states_offset(self, offset, stub_broker, api_client, state_middleware):
         for i in range(0, 10):
@@ -207,6 +244,10 @@ class TestMessageStateAPI:
         else:
             assert len(res.json["data"]) + offset == 10
 
+    def test_get_states_negative_offset(self, stub_broker, api_client, state_middleware):
+        res = api_client.post("/messages/states", data=json.dumps({"offset": -1}), content_type="application/json")
+        assert res.status_code == 400
+
     @pytest.mark.parametrize("size", [1, 5, 100])
     def test_get_states_page_size(self, size, stub_broker, api_client, state_middleware):
         for i in range(0, 10):
@@ -771,3 +771,33 @@ def test_complex_pipeline_pipe_on_error(stub_broker, stub_worker, stub_result_ba
     stub_worker.join()
 
     assert pipe.result.get(block=True, raise_on_error=False) == [1, "MemoryError('BOOM')", 1]
+
+
+def test_composition_message_ids(stub_broker, do_work):
+    # Given a pipeline containing a group of a message and a pipeline
+    inner_pipe = do_work.message() | do_work.message()
+    g = group([do_work.message(), inner_pipe])
+    pipe = pipeline((do_work.message(), g))
+
+    # Then its message ids follow the structure of the composition
+    first_id = pipe.children[0].message_id
+    group_id = g.children[0].message_id
+    assert pipe.message_ids == (first_id, [group_id, list(inner_pipe.message_ids)])
+    assert g.message_ids == (group_id, list(inner_pipe.message_ids))
+
+
+def test_build_group_pipeline_message_ids_are_copied(stub_broker, do_work):
+    inner_pipe = do_work.message() | do_work.message()
+    g = group([do_work.message(), inner_pipe])
+
+    with patch.object(stub_broker, "emit_before") as emit_before:
+        g.build(options={})
+
+    (message_ids,) = [
+        call_kwargs["message_ids"]
+        for (event, *_), call_kwargs in emit_before.call_args_list
+        if event == "build_group_pipeline"
+    ]
+    # a subscriber modifying the message ids does not change the ones of the group
+    message_ids[1].append("other_id")
+    assert g.message_ids == (g.children[0].message_id, list(inner_pipe.message_ids))
@@ -10,8 +10,8 @@ import remoulade
 from remoulade import CollectionResults, Result
 from remoulade.middleware import Retries
 from remoulade.results import ErrorStored, ResultBackend, ResultMissing, Results, ResultTimeout
-from remoulade.results.backend import ForgottenResult
-from remoulade.results.backends import StubBackend
+from remoulade.results.backend import BackendResult, ForgottenResult
+from remoulade.results.backends import RedisBackend, StubBackend
 from tests.conftest import fast_backoff
 
 
@@ -538,3 +538,44 @@ def test_redis_get_result_still_return_result_if_forget_fails(redis_result_backe
 def test_completed_count_no_messages(stub_broker, result_middleware):
     result = CollectionResults([])
     assert result.completed_count == 0
+
+
+def test_redis_get_status_in_batches(redis_result_backend):
+    redis_result_backend.status_batch_size = 2
+    message_ids = [f"id{i}" for i in range(5)]
+    redis_result_backend.store_results(message_ids[:3], [BackendResult(result=i, error=None) for i in range(3)], 10000)
+    assert redis_result_backend.get_status(message_ids) == 3
+
+
+def test_redis_status_batch_size_must_be_positive():
+    with pytest.raises(ValueError):
+        RedisBackend(status_batch_size=0)
+
+
+def test_completed_collection_does_not_query_backend(stub_broker, result_middleware):
+    result_backend = result_middleware.backend
+    message_ids = ["id0", "id1"]
+    result_backend.store_results(message_ids, [BackendResult(result=i, error=None) for i in range(2)], 10000)
+    results = CollectionResults([Result(message_id=message_id) for message_id in message_ids])
+    assert results.completed
+
+    with patch.object(result_backend, "get_status") as get_status:
+        assert results.completed
+        assert results.completed_count == 2
+        assert get_status.call_count == 0
+
+
+def test_collection_results_pass_the_remaining_timeout(stub_broker, result_middleware):
+    result_backend = result_middleware.backend
+    message_ids = ["id0", "id1"]
+    result_backend.store_results(message_ids, [BackendResult(result=i, error=None) for i in range(2)], 10000)
+    results = CollectionResults([Result(message_id="id0"), CollectionResults([Result(message_id="id1")])])
+
+    with patch.object(result_backend, "get_results", wraps=result_backend.get_results) as get_results:
+        assert list(results.get(block=True, timeout=10000)) == [0, [1]]
+
+    # the backends only receive the usual parameters of get_results
+    assert get_results.call_count == 2
+    for _, kwargs in get_results.call_args_list:
+        assert set(kwargs) == {"block", "timeout", "raise_on_error", "forget"}
+        assert 0 < kwargs["timeout"] <= 10000